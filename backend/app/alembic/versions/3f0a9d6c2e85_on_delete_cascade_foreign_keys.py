@@ -0,0 +1,48 @@
+"""on delete cascade for team, thread, member and provider children
+
+Revision ID: 3f0a9d6c2e85
+Revises: b7c1e94f3a26
+Create Date: 2026-10-15 15:12:40.387215
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3f0a9d6c2e85"
+down_revision = "b7c1e94f3a26"
+branch_labels = None
+depends_on = None
+
+# (table, column, referenced table) of every FK that cascades on delete
+CASCADE_FOREIGN_KEYS = [
+    ("member", "belongs_to", "team"),
+    ("thread", "team_id", "team"),
+    ("graph", "team_id", "team"),
+    ("subgraph", "team_id", "team"),
+    ("apikey", "team_id", "team"),
+    ("checkpoints", "thread_id", "thread"),
+    ("checkpoint_blobs", "thread_id", "thread"),
+    ("checkpoint_writes", "thread_id", "thread"),
+    ("memberskillslink", "member_id", "member"),
+    ("memberuploadslink", "member_id", "member"),
+    ("models", "provider_id", "modelprovider"),
+]
+
+
+def _recreate_foreign_keys(ondelete):
+    for table, column, referent in CASCADE_FOREIGN_KEYS:
+        # Constraints were created unnamed, so they carry Postgres' default name
+        name = f"{table}_{column}_fkey"
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(
+            name, table, referent, [column], ["id"], ondelete=ondelete
+        )
+
+
+def upgrade():
+    _recreate_foreign_keys("CASCADE")
+
+
+def downgrade():
+    _recreate_foreign_keys(None)
@@ -0,0 +1,74 @@
+"""add rbac and checkpoint indexes
+
+Revision ID: 5b9e2c7d41a8
+Revises: 1344a1718e96
+Create Date: 2026-10-15 10:12:31.402117
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b9e2c7d41a8"
+down_revision = "1344a1718e96"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_roleaccess_role_resource_action",
+            "roleaccess",
+            ["role_id", "resource_id", "action"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_audit_actor_ts",
+            "rbacauditlog",
+            ["actor_id", "timestamp"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_checkpoints_thread_ns_id",
+            "checkpoints",
+            ["thread_id", "checkpoint_ns", "checkpoint_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_checkpoints_thread_parent",
+            "checkpoints",
+            ["thread_id", "parent_checkpoint_id"],
+            unique=False,
+            postgresql_where=sa.text("parent_checkpoint_id IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_checkpoints_thread_parent",
+            table_name="checkpoints",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_checkpoints_thread_ns_id",
+            table_name="checkpoints",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_audit_actor_ts",
+            table_name="rbacauditlog",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_roleaccess_role_resource_action",
+            table_name="roleaccess",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,52 @@
+"""gin indexes on subgraph config and metadata
+
+Revision ID: 6c2d8e1f9a47
+Revises: a41e7c58d0b3
+Create Date: 2026-10-15 17:41:22.508736
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6c2d8e1f9a47"
+down_revision = "a41e7c58d0b3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_subgraph_config_gin",
+            "subgraph",
+            ["config"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"config": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_subgraph_metadata_gin",
+            "subgraph",
+            ["metadata"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_subgraph_metadata_gin",
+            table_name="subgraph",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_subgraph_config_gin",
+            table_name="subgraph",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,57 @@
+"""server side timestamps for apikey and upload
+
+Revision ID: 8d3f6a0e27c4
+Revises: 5b9e2c7d41a8
+Create Date: 2026-10-15 11:03:54.218930
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8d3f6a0e27c4"
+down_revision = "5b9e2c7d41a8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("UPDATE apikey SET created_at = now() WHERE created_at IS NULL")
+    op.alter_column(
+        "apikey",
+        "created_at",
+        existing_type=sa.DateTime(),
+        type_=sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.text("now()"),
+        postgresql_using="created_at AT TIME ZONE 'UTC'",
+    )
+    op.alter_column(
+        "upload",
+        "last_modified",
+        existing_type=sa.DateTime(),
+        type_=sa.DateTime(timezone=True),
+        existing_nullable=False,
+        server_default=sa.text("now()"),
+    )
+
+
+def downgrade():
+    op.alter_column(
+        "upload",
+        "last_modified",
+        existing_type=sa.DateTime(timezone=True),
+        type_=sa.DateTime(),
+        existing_nullable=False,
+        server_default=None,
+    )
+    op.alter_column(
+        "apikey",
+        "created_at",
+        existing_type=sa.DateTime(timezone=True),
+        type_=sa.DateTime(),
+        nullable=True,
+        server_default=None,
+        postgresql_using="created_at AT TIME ZONE 'UTC'",
+    )
@@ -0,0 +1,37 @@
+"""covering index for owner-scoped team listings
+
+Revision ID: a41e7c58d0b3
+Revises: 3f0a9d6c2e85
+Create Date: 2026-10-15 16:28:05.914623
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a41e7c58d0b3"
+down_revision = "3f0a9d6c2e85"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_team_owner_name",
+            "team",
+            ["owner_id", "name"],
+            unique=False,
+            postgresql_include=["resource_id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_team_owner_name",
+            table_name="team",
+            postgresql_concurrently=True,
+        )
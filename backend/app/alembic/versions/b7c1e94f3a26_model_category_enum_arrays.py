@@ -0,0 +1,74 @@
+"""native enum arrays for model categories and capabilities
+
+Revision ID: b7c1e94f3a26
+Revises: 8d3f6a0e27c4
+Create Date: 2026-10-15 13:47:09.651284
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "b7c1e94f3a26"
+down_revision = "8d3f6a0e27c4"
+branch_labels = None
+depends_on = None
+
+model_category = postgresql.ENUM(
+    "llm",
+    "chat",
+    "text-embedding",
+    "rerank",
+    "speech-to-text",
+    "text-to-speech",
+    name="model_category",
+)
+model_capability = postgresql.ENUM("vision", name="model_capability")
+
+
+def upgrade():
+    model_category.create(op.get_bind(), checkfirst=True)
+    model_capability.create(op.get_bind(), checkfirst=True)
+    op.alter_column(
+        "models",
+        "categories",
+        existing_type=postgresql.ARRAY(sa.String()),
+        type_=postgresql.ARRAY(model_category),
+        postgresql_using="categories::model_category[]",
+    )
+    op.alter_column(
+        "models",
+        "capabilities",
+        existing_type=postgresql.ARRAY(sa.String()),
+        type_=postgresql.ARRAY(model_capability),
+        postgresql_using="capabilities::model_capability[]",
+    )
+    op.create_index(
+        "models_categories_gin",
+        "models",
+        ["categories"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade():
+    op.drop_index("models_categories_gin", table_name="models")
+    op.alter_column(
+        "models",
+        "capabilities",
+        existing_type=postgresql.ARRAY(model_capability),
+        type_=postgresql.ARRAY(sa.String()),
+        postgresql_using="capabilities::varchar[]",
+    )
+    op.alter_column(
+        "models",
+        "categories",
+        existing_type=postgresql.ARRAY(model_category),
+        type_=postgresql.ARRAY(sa.String()),
+        postgresql_using="categories::varchar[]",
+    )
+    model_capability.drop(op.get_bind(), checkfirst=True)
+    model_category.drop(op.get_bind(), checkfirst=True)
@@ -4,10 +4,11 @@ from fastapi import APIRouter, HTTPException
 from sqlmodel import func, select
 
 from app.api.deps import CurrentUser, SessionDep
+from app.api.responses import ORJSONResponse
 from app.core.security import (generate_apikey, generate_short_apikey,
                                get_password_hash)
-from app.models import (ApiKey, ApiKeyCreate, ApiKeyOut, ApiKeysOutPublic,
-                        Message, Team)
+from app.models import (ApiKey, ApiKeyCreate, ApiKeyOut, ApiKeyOutPublic,
+                        ApiKeysOutPublic, Message, Team)
 
 router = APIRouter()
 
@@ -44,7 +45,12 @@ def read_api_keys(
             .limit(limit)
         )
         apikeys = session.exec(statement).all()
-    return ApiKeysOutPublic(data=apikeys, count=count)
+    return ORJSONResponse(
+        ApiKeysOutPublic.model_construct(
+            data=[ApiKeyOutPublic.from_orm_unvalidated(apikey) for apikey in apikeys],
+            count=count,
+        ).model_dump()
+    )
 
 
 @router.post("/", response_model=ApiKeyOut)
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import func, select
 
 from app.api.deps import CurrentUser, SessionDep, check_team_permission
+from app.api.responses import ORJSONResponse
 from app.core.security import resource_manager
 from app.models import (ActionType, Graph, GraphCreate, GraphOut, GraphsOut,
                         GraphUpdate, ResourceType, Team)
@@ -57,7 +58,12 @@ def read_graphs(
     statement = select(Graph).where(Graph.team_id == team_id).offset(skip).limit(limit)
     graphs = session.exec(statement).all()
 
-    return GraphsOut(data=graphs, count=count)
+    return ORJSONResponse(
+        GraphsOut.model_construct(
+            data=[GraphOut.from_orm_unvalidated(graph) for graph in graphs],
+            count=count,
+        ).model_dump()
+    )
 
 
 @router.get("/{id}", response_model=GraphOut)
@@ -5,9 +5,10 @@ from sqlalchemy.orm import selectinload
 from sqlmodel import func, select
 
 from app.api.deps import SessionDep, get_current_active_superuser
+from app.api.responses import ORJSONResponse
 from app.curd import groups
 from app.models import (Group, GroupCreate, GroupOut, GroupsOut, GroupUpdate,
-                        Message)
+                        Message, UserOut)
 
 router = APIRouter()
 
@@ -25,7 +26,22 @@ def read_groups(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
     )
     groups_list = session.exec(statement).all()
 
-    return GroupsOut(data=groups_list, count=count)
+    return ORJSONResponse(
+        GroupsOut.model_construct(
+            data=[
+                GroupOut.from_orm_unvalidated(
+                    group,
+                    admin=(
+                        UserOut.from_orm_unvalidated(group.admin)
+                        if group.admin
+                        else None
+                    ),
+                )
+                for group in groups_list
+            ],
+            count=count,
+        ).model_dump()
+    )
 
 
 @router.post(
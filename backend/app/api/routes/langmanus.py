@@ -261,6 +261,8 @@ async def generate_ppt(request: GeneratePPTRequest):
 
 @router.post("/prose/generate")
 async def generate_prose(request: GenerateProseRequest):
+    if request.option == "fix_batch":
+        return await _generate_prose_batch(request)
     try:
         sanitized_prompt = request.prompt.replace("\r\n", "").replace("\n", "")
         workflow = build_prose_graph()
@@ -281,6 +283,23 @@ async def generate_prose(request: GenerateProseRequest):
         raise HTTPException(status_code=500, detail=INTERNAL_SERVER_ERROR_DETAIL)
 
 
+async def _generate_prose_batch(request: GenerateProseRequest):
+    # Batch results come back together as JSON; streaming messages would
+    # interleave the tokens of the concurrently running generations.
+    try:
+        workflow = build_prose_graph()
+        final_state = await workflow.ainvoke(
+            {
+                "contents": request.contents,
+                "option": request.option,
+                "command": request.command,
+            }
+        )
+        return {"outputs": final_state["outputs"]}
+    except Exception:
+        raise HTTPException(status_code=500, detail=INTERNAL_SERVER_ERROR_DETAIL)
+
+
 @router.post("/mcp/server/metadata", response_model=MCPServerMetadataResponse)
 async def mcp_server_metadata(request: MCPServerMetadataRequest):
     try:
@@ -1,6 +1,7 @@
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import selectinload
 from sqlmodel import col, func, select
 
 from app.api.deps import CurrentUser, SessionDep
@@ -66,7 +67,11 @@ def read_members(
         count_statement = select(func.count()).select_from(Member)
         count = session.exec(count_statement).one()
         statement = (
-            select(Member).where(Member.belongs_to == team_id).offset(skip).limit(limit)
+            select(Member)
+            .options(selectinload(Member.skills), selectinload(Member.uploads))
+            .where(Member.belongs_to == team_id)
+            .offset(skip)
+            .limit(limit)
         )
         members = session.exec(statement).all()
     else:
@@ -79,6 +84,7 @@ def read_members(
         count = session.exec(count_statement).one()
         statement = (
             select(Member)
+            .options(selectinload(Member.skills), selectinload(Member.uploads))
             .join(Team)
             .where(Team.owner_id == current_user.id, Member.belongs_to == team_id)
             .offset(skip)
@@ -3,6 +3,7 @@ from typing import Any
 from fastapi import APIRouter, HTTPException
 
 from app.api.deps import SessionDep
+from app.api.responses import ORJSONResponse
 from app.curd.models import (_create_model, _delete_model, _update_model,
                              get_all_models, get_models_by_provider)
 from app.models import Models, ModelsBase, ModelsOut
@@ -34,12 +35,12 @@ def create_models(model: ModelCreate, session: SessionDep):
 
 @router.get("/{provider_id}", response_model=ModelsOut)
 def read_model(provider_id: int, session: SessionDep):
-    return get_models_by_provider(session, provider_id)
+    return ORJSONResponse(get_models_by_provider(session, provider_id).model_dump())
 
 
 @router.get("/", response_model=ModelsOut)
 def read_models(session: SessionDep):
-    return get_all_models(session)
+    return ORJSONResponse(get_all_models(session).model_dump())
 
 
 @router.delete("/{model_id}", response_model=Models)
@@ -1,9 +1,11 @@
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import selectinload
 from sqlmodel import func, select
 
 from app.api.deps import SessionDep, get_current_active_superuser
+from app.api.responses import ORJSONResponse
 from app.curd import roles
 from app.models import (Group, Message, Role, RoleCreate, RoleOut, RolesOut,
                         RoleUpdate)
@@ -36,7 +38,12 @@ def read_roles(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
 
     session.commit()
 
-    return RolesOut(data=roles_list, count=count)
+    return ORJSONResponse(
+        RolesOut.model_construct(
+            data=[RoleOut.from_orm_unvalidated(role) for role in roles_list],
+            count=count,
+        ).model_dump()
+    )
 
 
 @router.post(
@@ -118,7 +125,9 @@ def delete_role(session: SessionDep, role_id: int) -> Message:
     """
     Delete a role.
     """
-    role = session.get(Role, role_id)
+    # Deleting needs the user links, load them up front so this also works
+    # with LAZY_STRATEGY=raise_on_sql
+    role = session.get(Role, role_id, options=[selectinload(Role.users)])
     if not role:
         raise HTTPException(status_code=404, detail="Role not found")
     if role.is_system_role:
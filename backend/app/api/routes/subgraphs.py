@@ -1,11 +1,75 @@
+from collections.abc import Iterator
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import func, select
+from fastapi.responses import StreamingResponse
+from sqlalchemy import tuple_
+from sqlalchemy.orm import raiseload
+from sqlmodel import Session, col, func, select
 
 from app.api.deps import CurrentUser, SessionDep
-from app.models import (Message, Subgraph, SubgraphCreate, SubgraphOut,
-                        SubgraphsOut, SubgraphUpdate)
+from app.api.responses import ORJSON_OPTIONS, ORJSONResponse
+from app.core.db import engine
+from app.core.security import resource_manager
+from app.curd.subgraphs import bulk_create_subgraphs, subgraph_resource_name
+from app.models import (SUBGRAPH_OUT_FIELDS, Message, ResourceType, Subgraph,
+                        SubgraphCreate, SubgraphOut, SubgraphsOut,
+                        SubgraphUpdate)
+
+# 列表接口只查询 SubgraphOut 需要的列，行直接交给 orjson 序列化，
+# 跳过 ORM 实例和 Pydantic 模型的构建；
+# 其余接口加载 Subgraph 时使用 raiseload("*")，避免隐式懒加载 owner/team
+SUBGRAPH_OUT_COLS = tuple(
+    col(getattr(Subgraph, name)).label(name) for name in SUBGRAPH_OUT_FIELDS
+)
+
+# 超过这个 limit 的列表请求按批流式返回，峰值内存只与批大小有关
+STREAM_BATCH_SIZE = 1000
+
+
+def _stream_subgraphs(statement: Any, count: int) -> Iterator[bytes]:
+    # 依赖注入的 session 在响应发送前就会关闭，这里使用独立的 session
+    with Session(engine) as session:
+        result = session.exec(statement.execution_options(yield_per=STREAM_BATCH_SIZE))
+        yield b'{"data":['
+        separator = b""
+        for rows in result.partitions():
+            yield separator + b",".join(
+                orjson.dumps(
+                    dict(zip(SUBGRAPH_OUT_FIELDS, row, strict=True)),
+                    option=ORJSON_OPTIONS,
+                )
+                for row in rows
+            )
+            separator = b","
+        yield b'],"count":%d}' % count
+
+
+def _list_response(session: Session, statement: Any, count: int, limit: int) -> Any:
+    if limit > STREAM_BATCH_SIZE:
+        return StreamingResponse(
+            _stream_subgraphs(statement, count), media_type="application/json"
+        )
+    data = [
+        dict(zip(SUBGRAPH_OUT_FIELDS, row, strict=True))
+        for row in session.exec(statement)
+    ]
+    return ORJSONResponse({"data": data, "count": count})
+
+
+def _apply_update(
+    session: Session, subgraph: Subgraph, subgraph_in: SubgraphCreate | SubgraphUpdate
+) -> None:
+    # created_at/updated_at 由服务端维护，updated_at 只有在列值确实变化时才更新，
+    # 没有变化时 commit 不会产生 UPDATE
+    update_dict = subgraph_in.model_dump(
+        exclude_unset=True, exclude={"created_at", "updated_at"}
+    )
+    subgraph.sqlmodel_update(update_dict)
+    if session.is_modified(subgraph):
+        subgraph.updated_at = func.now()  # type: ignore[assignment]
+
 
 # 创建一个新的路由组，专门用于不需要team_id的操作
 public_router = APIRouter()
@@ -15,8 +79,12 @@ async def validate_name_on_create(
     session: SessionDep, subgraph_in: SubgraphCreate
 ) -> None:
     """Validate that subgraph name is unique within the team"""
-    statement = select(Subgraph).where(
-        Subgraph.name == subgraph_in.name, Subgraph.team_id == subgraph_in.team_id
+    statement = (
+        select(Subgraph)
+        .options(raiseload("*"))
+        .where(
+            Subgraph.name == subgraph_in.name, Subgraph.team_id == subgraph_in.team_id
+        )
     )
     subgraph = session.exec(statement).first()
     if subgraph:
@@ -31,14 +99,18 @@ async def validate_name_on_update(
     """Validate that subgraph name is unique within the team"""
     if not subgraph_in.name:
         return
-    existing_subgraph = session.get(Subgraph, id)
+    existing_subgraph = session.get(Subgraph, id, options=[raiseload("*")])
     if not existing_subgraph:
         raise HTTPException(status_code=404, detail="Subgraph not found")
 
-    statement = select(Subgraph).where(
-        Subgraph.name == subgraph_in.name,
-        Subgraph.team_id == existing_subgraph.team_id,
-        Subgraph.id != id,
+    statement = (
+        select(Subgraph)
+        .options(raiseload("*"))
+        .where(
+            Subgraph.name == subgraph_in.name,
+            Subgraph.team_id == existing_subgraph.team_id,
+            Subgraph.id != id,
+        )
     )
     subgraph = session.exec(statement).first()
     if subgraph:
@@ -60,11 +132,10 @@ def read_all_public_subgraphs(
     conditions = []  # 移除is_public过滤条件
 
     count_statement = select(func.count()).select_from(Subgraph).where(*conditions)
-    statement = select(Subgraph).where(*conditions).offset(skip).limit(limit)
+    statement = select(*SUBGRAPH_OUT_COLS).where(*conditions).offset(skip).limit(limit)
 
     count = session.exec(count_statement).one()
-    subgraphs = session.exec(statement).all()
-    return SubgraphsOut(data=subgraphs, count=count)
+    return _list_response(session, statement, count, limit)
 
 
 # 原有的路由保持不变
@@ -100,14 +171,15 @@ def read_subgraphs(
 
     if current_user.is_superuser and not team_id:
         count_statement = select(func.count()).select_from(Subgraph)
-        statement = select(Subgraph).offset(skip).limit(limit)
+        statement = select(*SUBGRAPH_OUT_COLS).offset(skip).limit(limit)
     else:
         count_statement = select(func.count()).select_from(Subgraph).where(where_clause)
-        statement = select(Subgraph).where(where_clause).offset(skip).limit(limit)
+        statement = (
+            select(*SUBGRAPH_OUT_COLS).where(where_clause).offset(skip).limit(limit)
+        )
 
     count = session.exec(count_statement).one()
-    subgraphs = session.exec(statement).all()
-    return SubgraphsOut(data=subgraphs, count=count)
+    return _list_response(session, statement, count, limit)
 
 
 @router.get("/{id}", response_model=SubgraphOut)
@@ -119,7 +191,7 @@ def read_subgraph(
     """
     Get subgraph by ID.
     """
-    subgraph = session.get(Subgraph, id)
+    subgraph = session.get(Subgraph, id, options=[raiseload("*")])
     if not subgraph:
         raise HTTPException(status_code=404, detail="Subgraph not found")
     if (
@@ -128,7 +200,7 @@ def read_subgraph(
         and subgraph.owner_id != current_user.id
     ):
         raise HTTPException(status_code=403, detail="Not enough permissions")
-    return subgraph
+    return ORJSONResponse(SubgraphOut.from_orm_unvalidated(subgraph))
 
 
 @router.post("/", response_model=SubgraphOut)
@@ -148,7 +220,9 @@ def create_subgraph(
 
     # 检查是否已存在同名subgraph在同一team中
     existing = session.exec(
-        select(Subgraph).where(
+        select(Subgraph)
+        .options(raiseload("*"))
+        .where(
             Subgraph.name == subgraph_in.name, Subgraph.team_id == subgraph_in.team_id
         )
     ).first()
@@ -156,25 +230,73 @@ def create_subgraph(
     if existing:
         # 如果存在且用户有权限,则更新
         if existing.owner_id == current_user.id or current_user.is_superuser:
-            update_dict = subgraph_in.model_dump(exclude_unset=True)
-            existing.sqlmodel_update(update_dict)
+            _apply_update(session, existing, subgraph_in)
             session.add(existing)
             session.commit()
             session.refresh(existing)
-            return existing
+            return ORJSONResponse(SubgraphOut.from_orm_unvalidated(existing))
         else:
             raise HTTPException(
                 status_code=403,
                 detail="A subgraph with this name already exists in this team",
             )
 
-    subgraph = Subgraph.model_validate(
-        subgraph_in, update={"owner_id": current_user.id}
+    # 创建subgraph对应的resource，命名与批量创建一致
+    resource = resource_manager.create_resource(
+        session=session,
+        name=subgraph_resource_name(subgraph_in.team_id, subgraph_in.name),
+        description=subgraph_in.description
+        or f"Subgraph resource for {subgraph_in.name}",
+        resource_type=ResourceType.SUBGRAPH,
+    )
+
+    # subgraph_in 已由 FastAPI 校验过，table 模型的构造函数不会再次校验
+    subgraph = Subgraph(
+        **subgraph_in.model_dump(exclude={"created_at", "updated_at"}),
+        owner_id=current_user.id,
+        resource_id=resource.id,
     )
     session.add(subgraph)
     session.commit()
     session.refresh(subgraph)
-    return subgraph
+    return ORJSONResponse(SubgraphOut.from_orm_unvalidated(subgraph))
+
+
+@router.post("/bulk", response_model=SubgraphsOut)
+def create_subgraphs(
+    *,
+    session: SessionDep,
+    current_user: CurrentUser,
+    subgraphs_in: list[SubgraphCreate],
+) -> Any:
+    """
+    Create several new subgraphs at once.
+    """
+    names = {(subgraph_in.team_id, subgraph_in.name) for subgraph_in in subgraphs_in}
+    if len(names) != len(subgraphs_in):
+        raise HTTPException(
+            status_code=400, detail="Duplicate subgraph names in the same team"
+        )
+    if names:
+        existing = session.exec(
+            select(Subgraph.id).where(
+                tuple_(col(Subgraph.team_id), col(Subgraph.name)).in_(list(names))
+            )
+        ).first()
+        if existing is not None:
+            raise HTTPException(
+                status_code=400, detail="Subgraph name already exists in this team"
+            )
+
+    ids = bulk_create_subgraphs(session, subgraphs_in, current_user.id)
+    session.commit()
+
+    statement = (
+        select(*SUBGRAPH_OUT_COLS)
+        .where(col(Subgraph.id).in_(ids))
+        .order_by(Subgraph.id)
+    )
+    return _list_response(session, statement, len(ids), len(ids))
 
 
 @router.put("/{id}", response_model=SubgraphOut)
@@ -189,18 +311,17 @@ def update_subgraph(
     """
     Update subgraph by ID.
     """
-    subgraph = session.get(Subgraph, id)
+    subgraph = session.get(Subgraph, id, options=[raiseload("*")])
     if not subgraph:
         raise HTTPException(status_code=404, detail="Subgraph not found")
     if not current_user.is_superuser and subgraph.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
 
-    update_dict = subgraph_in.model_dump(exclude_unset=True)
-    subgraph.sqlmodel_update(update_dict)
+    _apply_update(session, subgraph, subgraph_in)
     session.add(subgraph)
     session.commit()
     session.refresh(subgraph)
-    return subgraph
+    return ORJSONResponse(SubgraphOut.from_orm_unvalidated(subgraph))
 
 
 @router.delete("/{id}")
@@ -212,7 +333,7 @@ def delete_subgraph(
     """
     Delete subgraph by ID.
     """
-    subgraph = session.get(Subgraph, id)
+    subgraph = session.get(Subgraph, id, options=[raiseload("*")])
     if not subgraph:
         raise HTTPException(status_code=404, detail="Subgraph not found")
     if not current_user.is_superuser and subgraph.owner_id != current_user.id:
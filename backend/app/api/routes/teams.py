@@ -8,6 +8,7 @@ from sqlmodel import func, select
 
 from app.api.deps import (CurrentTeam, CurrentUser, SessionDep,
                           check_team_permission)
+from app.api.responses import ORJSONResponse
 from app.core.graph.build import generator
 from app.core.security import resource_manager
 from app.models import (ActionType, Member, ResourceType, Team, TeamChat,
@@ -58,7 +59,11 @@ def read_teams(
 
     total = session.exec(select(func.count(Team.id))).first()
     teams = session.exec(select(Team).offset(skip).limit(limit)).all()
-    return TeamsOut(data=teams, count=total)
+    return ORJSONResponse(
+        TeamsOut.model_construct(
+            data=[TeamOut.from_orm_unvalidated(team) for team in teams], count=total
+        ).model_dump()
+    )
 
 
 @router.get("/{id}", response_model=TeamOut)
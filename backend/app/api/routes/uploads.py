@@ -2,7 +2,6 @@ import logging
 import os
 import shutil
 import uuid
-from datetime import datetime
 from tempfile import NamedTemporaryFile
 from typing import IO, Annotated, Any
 
@@ -15,6 +14,7 @@ from sqlmodel import and_, func, select
 from starlette import status
 
 from app.api.deps import CurrentUser, SessionDep, check_team_permission
+from app.api.responses import ORJSONResponse
 from app.core.config import settings
 from app.core.security import resource_manager
 from app.models import (ActionType, Message, ResourceType, Upload,
@@ -115,7 +115,12 @@ def read_uploads(
     count = session.exec(count_statement).one()
     uploads = session.exec(statement).all()
 
-    return UploadsOut(data=uploads, count=count)
+    return ORJSONResponse(
+        UploadsOut.model_construct(
+            data=[UploadOut.from_orm_unvalidated(upload) for upload in uploads],
+            count=count,
+        ).model_dump()
+    )
 
 
 def get_file_type(filename: str) -> str:
@@ -299,7 +304,6 @@ def update_upload(
         update_data["chunk_overlap"] = chunk_overlap
 
     if update_data:
-        update_data["last_modified"] = datetime.now()
         update_dict = UploadUpdate(**update_data).model_dump(exclude_unset=True)
         upload.sqlmodel_update(update_dict)
         session.add(upload)
@@ -1,9 +1,11 @@
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import selectinload
 from sqlmodel import func, select
 
 from app.api.deps import CurrentUser, SessionDep, get_current_active_superuser
+from app.api.responses import ORJSONResponse
 from app.core.config import settings
 from app.core.security import get_password_hash, verify_password
 from app.curd import users
@@ -26,10 +28,19 @@ def read_users(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
     count_statement = select(func.count()).select_from(User)
     count = session.exec(count_statement).one()
 
-    statement = select(User).offset(skip).limit(limit)
+    statement = (
+        select(User)
+        .options(selectinload(User.groups), selectinload(User.roles))
+        .offset(skip)
+        .limit(limit)
+    )
     users = session.exec(statement).all()
 
-    return UsersOut(data=users, count=count)
+    return ORJSONResponse(
+        UsersOut.model_construct(
+            data=[UserOut.from_orm_unvalidated(user) for user in users], count=count
+        ).model_dump()
+    )
 
 
 @router.post(
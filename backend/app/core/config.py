@@ -162,6 +162,10 @@ class Settings(BaseSettings):
     CELERY_BROKER_URL: str | None = None
     CELERY_RESULT_BACKEND: str | None = None
     MAX_UPLOAD_SIZE: int = 50_000_000
+    # Loading strategy for rarely traversed relationships (Role.users,
+    # Role.parent_role, Resource.role_accesses). Use "raise_on_sql" in
+    # development to turn accidental lazy loads into errors.
+    LAZY_STRATEGY: Literal["select", "selectin", "raise_on_sql"] = "select"
 
     RECURSION_LIMIT: int = 25
     TAVILY_API_KEY: str | None = None
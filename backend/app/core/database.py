@@ -1,9 +1,28 @@
+from typing import Any
+
+import orjson
 from sqlalchemy import create_engine
 from sqlmodel import Session
 
 from app.core.config import settings
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+
+def json_serializer(value: Any) -> str:
+    """Serialize JSON/JSONB column values with orjson"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# With psycopg 3 SQLAlchemy installs this as the driver's JSON loader, so
+# JSONB columns (e.g. Subgraph.config and metadata) are decoded by orjson
+# before they reach the ORM. orjson also caches short object keys, so rows with
+# the same JSON shape share their key strings without extra interning.
+json_deserializer = orjson.loads
+
+engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
+)
 
 
 def get_session():
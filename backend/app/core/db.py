@@ -4,6 +4,7 @@ import os
 from sqlmodel import Session, create_engine, select
 
 from app.core.config import settings
+from app.core.database import json_deserializer, json_serializer
 from app.core.model_providers.model_provider_manager import \
     model_provider_manager
 from app.core.tools import managed_tools
@@ -154,7 +155,11 @@ def init_default_roles_and_groups(session: Session, superuser: User) -> None:
     session.commit()
 
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
+)
 # engine = create_engine(get_url())
 
 
@@ -19,6 +19,7 @@ from langgraph.types import Command
 from psycopg import AsyncConnection
 
 from app.core.config import settings
+from app.core.graph.checkpoint.serde import checkpoint_serde
 from app.core.graph.members import (GraphLeader, GraphMember, GraphTeam,
                                     GraphTeamState, LeaderNode,
                                     SequentialWorkerNode, SummariserNode,
@@ -639,7 +640,7 @@ async def generator(
             settings.PG_DATABASE_URI,
             **settings.SQLALCHEMY_CONNECTION_KWARGS,
         ) as conn:
-            checkpointer = AsyncPostgresSaver(conn=conn)
+            checkpointer = AsyncPostgresSaver(conn=conn, serde=checkpoint_serde)
             if team.workflow == "hierarchical":
                 teams = convert_hierarchical_team_to_dict(team, members)
                 team_leader = list(teams.keys())[0]
@@ -0,0 +1,63 @@
+import threading
+from typing import Any
+
+import zstandard
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+# Suffix appended to the serialized type of compressed blobs, so rows written
+# before compression was enabled are still loaded as-is.
+ZSTD_TYPE_SUFFIX = "+zstd"
+ZSTD_LEVEL = 3
+# Blobs smaller than this are stored uncompressed, zstd would not pay off
+ZSTD_MIN_SIZE = 1024
+
+# zstandard (de)compressor instances must not be shared between threads
+_local = threading.local()
+
+
+def _compressor() -> zstandard.ZstdCompressor:
+    if not hasattr(_local, "compressor"):
+        _local.compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+    return _local.compressor
+
+
+def _decompressor() -> zstandard.ZstdDecompressor:
+    if not hasattr(_local, "decompressor"):
+        _local.decompressor = zstandard.ZstdDecompressor()
+    return _local.decompressor
+
+
+class ZstdSerializer(SerializerProtocol):
+    """
+    Checkpoint serializer that zstd-compresses channel blobs and pending writes.
+
+    Wraps another serializer (JsonPlusSerializer by default). Only the typed
+    methods, which produce the checkpoint_blobs and checkpoint_writes payloads,
+    are compressed.
+    """
+
+    def __init__(self, serde: SerializerProtocol | None = None) -> None:
+        self.serde = serde or JsonPlusSerializer()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self.serde.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self.serde.loads(data)
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        type_, data = self.serde.dumps_typed(obj)
+        if data is None or len(data) < ZSTD_MIN_SIZE:
+            return type_, data
+        return type_ + ZSTD_TYPE_SUFFIX, _compressor().compress(data)
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        type_, blob = data
+        if type_.endswith(ZSTD_TYPE_SUFFIX):
+            type_ = type_[: -len(ZSTD_TYPE_SUFFIX)]
+            blob = _decompressor().decompress(blob)
+        return self.serde.loads_typed((type_, blob))
+
+
+checkpoint_serde = ZstdSerializer()
@@ -10,6 +10,7 @@ from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 from psycopg import AsyncConnection
 
 from app.core.config import settings
+from app.core.graph.checkpoint.serde import checkpoint_serde
 from app.core.graph.messages import ChatResponse
 
 
@@ -132,7 +133,7 @@ async def get_checkpoint_tuples(thread_id: str) -> CheckpointTuple | None:
     async with await AsyncConnection.connect(
         settings.PG_DATABASE_URI, **settings.SQLALCHEMY_CONNECTION_KWARGS
     ) as conn:
-        checkpointer = AsyncPostgresSaver(conn=conn)
+        checkpointer = AsyncPostgresSaver(conn=conn, serde=checkpoint_serde)
         checkpoint_tuple = await checkpointer.aget_tuple(
             {"configurable": {"thread_id": thread_id}}
         )
@@ -5,6 +5,7 @@ import os
 from pathlib import Path
 from typing import Any, Dict
 
+import httpx
 from langchain_openai import ChatOpenAI
 
 from app.core.langmanus.config import load_yaml_config
@@ -13,6 +14,41 @@ from app.core.langmanus.config.agents import LLMType
 # Cache for LLM instances
 _llm_cache: dict[LLMType, ChatOpenAI] = {}
 
+# Connection pools shared by every LLM client, so keep-alive connections to the
+# model endpoints are reused across requests and LLM types. They are created on
+# first use inside the running app (an AsyncClient's pool is bound to the event
+# loop it first runs on) and closed by close_http_clients() at shutdown.
+_http_limits = httpx.Limits(max_connections=1024, max_keepalive_connections=512)
+_http_timeout = httpx.Timeout(connect=5.0, read=120.0, write=60.0, pool=None)
+_http_client: httpx.Client | None = None
+_http_async_client: httpx.AsyncClient | None = None
+
+
+def _get_http_clients() -> tuple[httpx.Client, httpx.AsyncClient]:
+    global _http_client, _http_async_client
+    if _http_client is None:
+        _http_client = httpx.Client(limits=_http_limits, timeout=_http_timeout)
+    if _http_async_client is None:
+        _http_async_client = httpx.AsyncClient(
+            limits=_http_limits, timeout=_http_timeout
+        )
+    return _http_client, _http_async_client
+
+
+async def close_http_clients() -> None:
+    """
+    Close the shared connection pools and drop the cached LLM instances that
+    hold them, so the next get_llm_by_type() starts with fresh clients.
+    """
+    global _http_client, _http_async_client
+    _llm_cache.clear()
+    if _http_async_client is not None:
+        await _http_async_client.aclose()
+        _http_async_client = None
+    if _http_client is not None:
+        _http_client.close()
+        _http_client = None
+
 
 def _get_env_llm_conf(llm_type: str) -> Dict[str, Any]:
     """
@@ -47,6 +83,12 @@ def _create_llm_use_conf(llm_type: LLMType, conf: Dict[str, Any]) -> ChatOpenAI:
     if not merged_conf:
         raise ValueError(f"Unknown LLM Conf: {llm_type}")
 
+    http_client, http_async_client = _get_http_clients()
+    merged_conf.setdefault("timeout", _http_timeout)
+    merged_conf.setdefault("max_retries", 3)
+    merged_conf.setdefault("http_client", http_client)
+    merged_conf.setdefault("http_async_client", http_async_client)
+
     return ChatOpenAI(**merged_conf)
 
 
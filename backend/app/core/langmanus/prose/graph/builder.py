@@ -8,7 +8,8 @@ from langgraph.graph import END, START, StateGraph
 
 from app.core.langmanus.prose.graph.prose_continue_node import \
     prose_continue_node
-from app.core.langmanus.prose.graph.prose_fix_node import prose_fix_node
+from app.core.langmanus.prose.graph.prose_fix_node import (
+    prose_fix_batch_node, prose_fix_node)
 from app.core.langmanus.prose.graph.prose_improve_node import \
     prose_improve_node
 from app.core.langmanus.prose.graph.prose_longer_node import prose_longer_node
@@ -31,6 +32,7 @@ def build_graph():
     builder.add_node("prose_shorter", prose_shorter_node)
     builder.add_node("prose_longer", prose_longer_node)
     builder.add_node("prose_fix", prose_fix_node)
+    builder.add_node("prose_fix_batch", prose_fix_batch_node)
     builder.add_node("prose_zap", prose_zap_node)
     builder.add_conditional_edges(
         START,
@@ -41,6 +43,7 @@ def build_graph():
             "shorter": "prose_shorter",
             "longer": "prose_longer",
             "fix": "prose_fix",
+            "fix_batch": "prose_fix_batch",
             "zap": "prose_zap",
         },
         END,
@@ -1,9 +1,13 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import hashlib
 import logging
+import os
+import time
+from collections import OrderedDict
 
-from langchain.schema import HumanMessage, SystemMessage
+from langchain.schema import AIMessage, HumanMessage, SystemMessage
 
 from app.core.langmanus.config.agents import AGENT_LLM_MAP
 from app.core.langmanus.llms.llm import get_llm_by_type
@@ -12,15 +16,74 @@ from app.core.langmanus.prose.graph.state import ProseState
 
 logger = logging.getLogger(__name__)
 
+_PROSE_FIX_SYSTEM = SystemMessage(content=get_prompt_template("prose/prose_fix"))
 
-def prose_fix_node(state: ProseState):
+# Upper bound on concurrent LLM requests issued for a single batch
+_BATCH_MAX_CONCURRENCY = 16
+
+# Exact-match response cache, keyed by a hash of the stripped input text
+PROSE_FIX_CACHE_ENABLED = (
+    os.getenv("PROSE_FIX_CACHE_ENABLED", "false").lower() == "true"
+)
+PROSE_FIX_CACHE_SIZE = int(os.getenv("PROSE_FIX_CACHE_SIZE", "1024"))
+PROSE_FIX_CACHE_TTL = float(os.getenv("PROSE_FIX_CACHE_TTL", "3600"))
+
+_response_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+
+def _cache_key(content: str) -> str:
+    return hashlib.blake2b(content.strip().encode(), digest_size=16).hexdigest()
+
+
+def _cache_get(key: str) -> str | None:
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, output = entry
+    if expires_at < time.monotonic():
+        del _response_cache[key]
+        return None
+    _response_cache.move_to_end(key)
+    return output
+
+
+def _cache_put(key: str, output: str) -> None:
+    _response_cache[key] = (time.monotonic() + PROSE_FIX_CACHE_TTL, output)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > PROSE_FIX_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+
+
+def _build_messages(content: str) -> list:
+    return [
+        _PROSE_FIX_SYSTEM,
+        HumanMessage(content=f"The existing text is: {content}"),
+    ]
+
+
+async def prose_fix_node(state: ProseState):
     logger.info("Generating prose fix content...")
+    if PROSE_FIX_CACHE_ENABLED:
+        key = _cache_key(state["content"])
+        cached = _cache_get(key)
+        if cached is not None:
+            logger.info("prose fix cache hit")
+            # Emit the cached answer as a message so stream_mode="messages"
+            # consumers receive it just like a streamed LLM response.
+            return {"messages": [AIMessage(content=cached)], "output": cached}
     model = get_llm_by_type(AGENT_LLM_MAP["prose_writer"])
-    prose_content = model.invoke(
-        [
-            SystemMessage(content=get_prompt_template("prose/prose_fix")),
-            HumanMessage(content=f"The existing text is: {state['content']}"),
-        ],
-    )
-    logger.info(f"prose_content: {prose_content}")
+    prose_content = await model.ainvoke(_build_messages(state["content"]))
+    logger.debug("prose_content: %r", prose_content)
+    if PROSE_FIX_CACHE_ENABLED:
+        _cache_put(key, prose_content.content)
     return {"output": prose_content.content}
+
+
+async def prose_fix_batch_node(state: ProseState):
+    logger.info("Generating prose fix content in batch...")
+    model = get_llm_by_type(AGENT_LLM_MAP["prose_writer"])
+    results = await model.abatch(
+        [_build_messages(content) for content in state["contents"]],
+        config={"max_concurrency": _BATCH_MAX_CONCURRENCY},
+    )
+    return {"outputs": [result.content for result in results]}
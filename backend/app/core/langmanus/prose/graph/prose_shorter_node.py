@@ -22,5 +22,5 @@ def prose_shorter_node(state: ProseState):
             HumanMessage(content=f"The existing text is: {state['content']}"),
         ],
     )
-    logger.info(f"prose_content: {prose_content}")
+    logger.debug("prose_content: %r", prose_content)
     return {"output": prose_content.content}
@@ -24,5 +24,5 @@ def prose_zap_node(state: ProseState):
             ),
         ],
     )
-    logger.info(f"prose_content: {prose_content}")
+    logger.debug("prose_content: %r", prose_content)
     return {"output": prose_content.content}
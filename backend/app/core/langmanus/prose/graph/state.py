@@ -10,7 +10,10 @@ class ProseState(MessagesState):
     # The content of the prose
     content: str = ""
 
-    # Prose writer option: continue, improve, shorter, longer, fix, zap
+    # Multiple contents to be processed in one batch (fix_batch option)
+    contents: list[str] = []
+
+    # Prose writer option: continue, improve, shorter, longer, fix, fix_batch, zap
     option: str = ""
 
     # The user custom command for the prose writer
@@ -18,3 +21,6 @@ class ProseState(MessagesState):
 
     # Output
     output: str = ""
+
+    # Outputs of a batch run, in the same order as contents
+    outputs: list[str] = []
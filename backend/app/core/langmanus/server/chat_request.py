@@ -3,7 +3,7 @@
 
 from typing import List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from app.core.langmanus.rag.retriever import Resource
 
@@ -85,8 +85,21 @@ class GeneratePPTRequest(BaseModel):
 
 
 class GenerateProseRequest(BaseModel):
-    prompt: str = Field(..., description="The content of the prose")
+    prompt: str | None = Field(None, description="The content of the prose")
     option: str = Field(..., description="The option of the prose writer")
     command: Optional[str] = Field(
         "", description="The user custom command of the prose writer"
     )
+    contents: list[str] | None = Field(
+        None, description="The contents to fix in one batch (fix_batch option)"
+    )
+
+    @model_validator(mode="after")
+    def check_input(self) -> "GenerateProseRequest":
+        # fix_batch reads only contents, every other option reads only prompt
+        if self.option == "fix_batch":
+            if not self.contents:
+                raise ValueError("contents is required for the fix_batch option")
+        elif self.prompt is None:
+            raise ValueError(f"prompt is required for the {self.option} option")
+        return self
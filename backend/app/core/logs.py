@@ -0,0 +1,43 @@
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+_listener: QueueListener | None = None
+
+
+def start_queue_logging() -> None:
+    """
+    Hand the root logger's handlers over to a background thread.
+
+    Logging calls only put the record on a queue; a QueueListener writes it
+    to the original handlers (stdout, files), so their I/O no longer blocks
+    the request or the event loop.
+    """
+    global _listener
+    if _listener is not None:
+        return
+    root = logging.getLogger()
+    handlers = [h for h in root.handlers if not isinstance(h, QueueHandler)]
+    if not handlers:
+        return
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_queue_logging() -> None:
+    """Flush queued records and give the root logger its handlers back."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        if isinstance(handler, QueueHandler):
+            root.removeHandler(handler)
+    for handler in _listener.handlers:
+        root.addHandler(handler)
+    _listener = None
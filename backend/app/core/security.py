@@ -6,10 +6,11 @@ import jwt
 from cryptography.fernet import Fernet
 from fastapi import HTTPException
 from passlib.context import CryptContext
-from sqlmodel import Session
+from sqlmodel import Session, col, or_, select
 
 from app.core.config import settings
-from app.models import ActionType, Resource, ResourceType, User
+from app.models import (ActionType, GroupResource, Resource, ResourceType,
+                        RoleAccess, User, UserGroup, UserRole)
 
 
 class SecurityManager:
@@ -87,6 +88,48 @@ class ResourceManager:
         session.flush()  # 获取resource.id
         return resource
 
+    @staticmethod
+    def user_has_permission(
+        session: Session,
+        user_id: int,
+        resource_type: ResourceType,
+        action_type: ActionType,
+        resource_id: str | None = None,
+    ) -> bool:
+        """在一次查询中检查用户通过角色或用户组是否拥有权限
+
+        角色需要对资源拥有对应操作的访问权限，用户组只要关联了资源即可。
+        resource_id 为空时检查资源类型级别的权限，否则检查具体资源实例的权限。
+        """
+        if resource_id is None:
+            resource_match = col(Resource.resource_id).is_(None)
+        else:
+            resource_match = col(Resource.resource_id) == resource_id
+
+        via_roles = (
+            select(RoleAccess.id)
+            .join(UserRole, col(UserRole.role_id) == RoleAccess.role_id)
+            .join(Resource, col(Resource.id) == RoleAccess.resource_id)
+            .where(
+                UserRole.user_id == user_id,
+                RoleAccess.action == action_type,
+                Resource.type == resource_type,
+                resource_match,
+            )
+        )
+        via_groups = (
+            select(GroupResource.resource_id)
+            .join(UserGroup, col(UserGroup.group_id) == GroupResource.group_id)
+            .join(Resource, col(Resource.id) == GroupResource.resource_id)
+            .where(
+                UserGroup.user_id == user_id,
+                Resource.type == resource_type,
+                resource_match,
+            )
+        )
+        statement = select(or_(via_roles.exists(), via_groups.exists()))
+        return bool(session.scalar(statement))
+
     @staticmethod
     def check_permission(
         session: Session,
@@ -116,41 +159,9 @@ class ResourceManager:
         if user.is_superuser:
             return True
 
-        has_permission = False
-
-        # 通过用户的角色检查权限
-        for role in user.roles:
-            for access in role.accesses:
-                if (
-                    access.resource.type == resource_type
-                    and access.action == action_type
-                ):
-                    # 如果是资源类型级别的权限检查
-                    if resource_id is None and access.resource.resource_id is None:
-                        has_permission = True
-                        break
-                    # 如果是具体资源实例的权限检查
-                    if resource_id and access.resource.resource_id == resource_id:
-                        has_permission = True
-                        break
-            if has_permission:
-                break
-
-        # 如果角色没有权限，通过用户组检查权限
-        if not has_permission:
-            for group in user.groups:
-                for resource in group.resources:
-                    if resource.type == resource_type:
-                        # 如果是资源类型级别的权限检查
-                        if resource_id is None and resource.resource_id is None:
-                            has_permission = True
-                            break
-                        # 如果是具体资源实例的权限检查
-                        if resource_id and resource.resource_id == resource_id:
-                            has_permission = True
-                            break
-                if has_permission:
-                    break
+        has_permission = ResourceManager.user_has_permission(
+            session, user.id, resource_type, action_type, resource_id
+        )
 
         if not has_permission and raise_exception:
             raise HTTPException(
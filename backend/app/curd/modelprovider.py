@@ -1,5 +1,6 @@
 from typing import Any
 
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 
 from ..models import (ModelOutIdWithAndName, ModelProvider,
@@ -132,7 +133,7 @@ def get_model_provider_with_models(
 def get_model_provider_list_with_models(
     session: Session,
 ) -> ProvidersListWithModelsOut:
-    statement = select(ModelProvider)
+    statement = select(ModelProvider).options(selectinload(ModelProvider.models))
     results = session.exec(statement).all()
 
     providers_list = []
@@ -1,3 +1,4 @@
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, func, select
 
 from ..models import ModelOut, ModelProviderOut, Models, ModelsBase, ModelsOut
@@ -35,30 +36,25 @@ def get_models_by_provider(session: Session, provider_id: int) -> ModelsOut:
 
     # 构建 ModelOut 列表
     model_outs = [
-        ModelOut(
+        ModelOut.model_construct(
             id=model.id,
             ai_model_name=model.ai_model_name,
             categories=model.categories,
             capabilities=model.capabilities,
-            provider=ModelProviderOut(
-                id=model.provider.id,
-                provider_name=model.provider.provider_name,
-                base_url=model.provider.base_url,
-                api_key=model.provider.encrypted_api_key,
-                icon=model.provider.icon,
-                description=model.provider.description,
+            provider=ModelProviderOut.from_orm_unvalidated(
+                model.provider, api_key=model.provider.encrypted_api_key
             ),
         )
         for model in models
     ]
 
     # 返回 ModelsOut 对象
-    return ModelsOut(data=model_outs, count=total_count)
+    return ModelsOut.model_construct(data=model_outs, count=total_count)
 
 
 def get_all_models(session: Session) -> ModelsOut:
     # 查询所有模型
-    statement = select(Models)
+    statement = select(Models).options(selectinload(Models.provider))
     models_result = session.exec(statement)
     models = models_result.all()
 
@@ -73,25 +69,20 @@ def get_all_models(session: Session) -> ModelsOut:
 
     # 构建 ModelOut 列表
     model_outs = [
-        ModelOut(
+        ModelOut.model_construct(
             id=model.id,
             ai_model_name=model.ai_model_name,
             categories=model.categories,
             capabilities=model.capabilities,
-            provider=ModelProviderOut(
-                id=model.provider.id,
-                provider_name=model.provider.provider_name,
-                base_url=model.provider.base_url,
-                api_key=model.provider.encrypted_api_key,
-                icon=model.provider.icon,
-                description=model.provider.description,
+            provider=ModelProviderOut.from_orm_unvalidated(
+                model.provider, api_key=model.provider.encrypted_api_key
             ),
         )
         for model in models
     ]
 
     # 返回 ModelsOut 对象
-    return ModelsOut(data=model_outs, count=total_count)
+    return ModelsOut.model_construct(data=model_outs, count=total_count)
 
 
 def _delete_model(session: Session, model_id: int) -> Models | None:
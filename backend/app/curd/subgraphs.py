@@ -0,0 +1,52 @@
+from sqlalchemy import insert
+from sqlmodel import Session
+
+from ..models import Resource, ResourceType, Subgraph, SubgraphCreate
+
+
+def subgraph_resource_name(team_id: int, name: str) -> str:
+    """subgraph 对应 resource 的命名约定：subgraph_{team_id}_{name}
+
+    与 team_{name}、graph_{name} 不同，subgraph 名称只在 team 内唯一，而
+    resource.name 全局唯一，所以名称中必须带上 team_id。
+    """
+    return f"subgraph_{team_id}_{name}"
+
+
+def bulk_create_subgraphs(
+    session: Session, subgraphs_in: list[SubgraphCreate], owner_id: int
+) -> list[int]:
+    """批量创建 subgraph 及其对应的 resource
+
+    resource 和 subgraph 各用一条 INSERT ... RETURNING 写入，不经过逐个对象的
+    unit-of-work flush。返回的 id 与 subgraphs_in 的顺序一致。
+    不会提交事务，由调用方 commit。
+    """
+    if not subgraphs_in:
+        return []
+
+    resource_ids = session.scalars(
+        insert(Resource).returning(Resource.id, sort_by_parameter_order=True),
+        [
+            {
+                "name": subgraph_resource_name(subgraph_in.team_id, subgraph_in.name),
+                "description": subgraph_in.description
+                or f"Subgraph resource for {subgraph_in.name}",
+                "type": ResourceType.SUBGRAPH,
+            }
+            for subgraph_in in subgraphs_in
+        ],
+    ).all()
+
+    subgraph_ids = session.scalars(
+        insert(Subgraph).returning(Subgraph.id, sort_by_parameter_order=True),
+        [
+            {
+                **subgraph_in.model_dump(exclude={"created_at", "updated_at"}),
+                "owner_id": owner_id,
+                "resource_id": resource_id,
+            }
+            for subgraph_in, resource_id in zip(subgraphs_in, resource_ids, strict=True)
+        ],
+    ).all()
+    return list(subgraph_ids)
@@ -7,8 +7,11 @@ from sqlmodel import Session
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
+from app.api.responses import ORJSONResponse
 from app.core.config import settings
 from app.core.db import engine, init_db, init_modelprovider_model_db
+from app.core.langmanus.llms.llm import close_http_clients
+from app.core.logs import start_queue_logging, stop_queue_logging
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -22,17 +25,23 @@ if settings.SENTRY_DSN:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    start_queue_logging()
     with Session(engine) as session:
         init_db(session)
         init_modelprovider_model_db(session)
+    # Build (and cache) the OpenAPI schema now instead of on the first docs request
+    app.openapi()
     yield
     # Shutdown
+    await close_http_clients()
+    stop_queue_logging()
 
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    default_response_class=ORJSONResponse,
     debug=True,
     lifespan=lifespan,
 )
@@ -1,22 +1,30 @@
+import os
+import string
+import time
+from dataclasses import dataclass, fields
 from datetime import datetime
-from enum import Enum
-from typing import TYPE_CHECKING, Any, List, Optional
-from uuid import UUID, uuid4
-from zoneinfo import ZoneInfo
+from enum import StrEnum
+from functools import cached_property
+from typing import Annotated, Any, Optional, TypedDict
+from uuid import UUID
 
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, ConfigDict
 from pydantic import Field as PydanticField
-from pydantic import model_validator
+from pydantic import field_validator, model_validator, with_config
 from sqlalchemy import ARRAY, JSON, Column, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import PrimaryKeyConstraint, String, UniqueConstraint, func
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import (Index, PrimaryKeyConstraint, String, TypeDecorator,
+                        UniqueConstraint, func, text)
+from sqlalchemy.dialects.postgresql import ENUM, JSONB
 from sqlmodel import Field, Relationship, SQLModel
 
+from app.core.config import settings
 from app.core.graph.messages import ChatResponse
 
-if TYPE_CHECKING:
-    from app.core.security import security_manager
+# Shared validation patterns for user-facing names
+NAME_PATTERN = r"^[a-zA-Z0-9_-]{1,64}$"
+MODEL_NAME_PATTERN = r"^[a-zA-Z0-9/_:.-]{1,64}$"
 
 
 class Message(SQLModel):
@@ -39,6 +47,46 @@ class NewPassword(SQLModel):
     new_password: str
 
 
+def uuid7() -> UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7): 48-bit Unix milliseconds followed
+    by random bits, so new primary keys land at the right edge of the B-tree
+    instead of splitting pages all over the index like uuid4 does.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    value = value & ~(0xF << 76) | 0x7 << 76  # version
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return UUID(int=value)
+
+
+def ts_col(server_default: Any = None, onupdate: Any = None) -> Column:
+    """Non-null timezone-aware timestamp column, defaulting to now()"""
+    if server_default is None:
+        server_default = func.now()
+    return Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=server_default,
+        onupdate=onupdate,
+        server_default=server_default,
+    )
+
+
+class TrustedOut(SQLModel):
+    """Output schema that can be filled straight from database rows"""
+
+    @classmethod
+    def from_orm_unvalidated(cls, obj: Any, **values: Any) -> Any:
+        """Build the schema from a trusted ORM object without re-validating it.
+
+        Fields not passed in ``values`` are read from ``obj`` by name.
+        """
+        for name in cls.model_fields:
+            if name not in values:
+                values[name] = getattr(obj, name)
+        return cls.model_construct(**values)
+
+
 class GroupResource(SQLModel, table=True):
     """Group-Resource association table"""
 
@@ -49,7 +97,7 @@ class GroupResource(SQLModel, table=True):
 
 
 # =============RESOURCE=========================
-class ResourceType(str, Enum):
+class ResourceType(StrEnum):
     """Resource type enumeration"""
 
     TEAM = "team"
@@ -63,7 +111,7 @@ class ResourceType(str, Enum):
     SYSTEM = "system"
 
 
-class ActionType(str, Enum):
+class ActionType(StrEnum):
     """Action type enumeration"""
 
     CREATE = "create"
@@ -74,7 +122,7 @@ class ActionType(str, Enum):
     MANAGE = "manage"
 
 
-class AccessScope(str, Enum):
+class AccessScope(StrEnum):
     """Access scope enumeration"""
 
     GLOBAL = "global"
@@ -82,18 +130,37 @@ class AccessScope(str, Enum):
     PERSONAL = "personal"
 
 
+class StrEnumString(TypeDecorator):
+    """String column whose values are loaded back as members of a StrEnum"""
+
+    impl = String
+    cache_ok = True
+
+    def __init__(self, enum_cls: type[StrEnum], *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.enum_cls = enum_cls
+        self._members = enum_cls._value2member_map_
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Any:
+        return None if value is None else str(value)
+
+    def process_result_value(self, value: Any, dialect: Any) -> Any:
+        # Enum members are singletons, so every loaded row shares one object
+        return None if value is None else self._members.get(value, value)
+
+
+# Enum column types are built once here and reused by the table models
+_RESOURCE_TYPE_TYPE = StrEnumString(ResourceType)
+_ACTION_TYPE_TYPE = SQLEnum(ActionType, name="actiontype")
+_ACCESS_SCOPE_TYPE = SQLEnum(AccessScope, name="accessscope")
+
+
 class RBACAuditLog(SQLModel, table=True):
     """Audit log for RBAC-related actions"""
 
+    __table_args__ = (Index("ix_audit_actor_ts", "actor_id", "timestamp"),)
     id: int | None = Field(default=None, primary_key=True)
-    timestamp: datetime = Field(
-        sa_column=Column(
-            DateTime(timezone=True),
-            nullable=False,
-            default=func.now(),
-            server_default=func.now(),
-        )
-    )
+    timestamp: datetime = Field(sa_column=ts_col())
     actor_id: int = Field(foreign_key="user.id")
     action: str  # e.g. "grant_role", "revoke_permission"
     target_type: str  # e.g. "role", "permission"
@@ -106,7 +173,7 @@ class ResourceBase(SQLModel):
 
     name: str = Field(unique=True, index=True)
     description: str | None = None
-    type: ResourceType = Field(sa_column=Column(String, nullable=False))
+    type: ResourceType = Field(sa_column=Column(_RESOURCE_TYPE_TYPE, nullable=False))
     resource_id: str | None = None  # 具体资源ID，可以为空表示资源类型级别的权限
 
 
@@ -116,10 +183,13 @@ class Resource(ResourceBase, table=True):
     id: int | None = Field(default=None, primary_key=True)
 
     # Relationships
-    groups: List["Group"] = Relationship(
+    groups: list["Group"] = Relationship(
         back_populates="resources", link_model=GroupResource
     )
-    role_accesses: List["RoleAccess"] = Relationship(back_populates="resource")
+    role_accesses: list["RoleAccess"] = Relationship(
+        back_populates="resource",
+        sa_relationship_kwargs={"lazy": settings.LAZY_STRATEGY},
+    )
 
 
 class ResourceCreate(ResourceBase):
@@ -159,11 +229,17 @@ class UserGroup(SQLModel, table=True):
 class RoleAccess(SQLModel, table=True):
     """Role-Resource access control table"""
 
+    __table_args__ = (
+        Index("ix_roleaccess_role_resource_action", "role_id", "resource_id", "action"),
+    )
     id: int | None = Field(default=None, primary_key=True)
     role_id: int = Field(foreign_key="role.id")
     resource_id: int = Field(foreign_key="resource.id")
-    action: ActionType
-    scope: AccessScope = Field(default=AccessScope.GLOBAL)
+    action: ActionType = Field(sa_column=Column(_ACTION_TYPE_TYPE, nullable=False))
+    scope: AccessScope = Field(
+        default=AccessScope.GLOBAL,
+        sa_column=Column(_ACCESS_SCOPE_TYPE, nullable=False),
+    )
 
     # Relationships
     role: "Role" = Relationship(back_populates="accesses")
@@ -188,11 +264,11 @@ class Group(GroupBase, table=True):
     id: int | None = Field(default=None, primary_key=True)
 
     # Relationships
-    users: List["User"] = Relationship(back_populates="groups", link_model=UserGroup)
-    resources: List["Resource"] = Relationship(
+    users: list["User"] = Relationship(back_populates="groups", link_model=UserGroup)
+    resources: list["Resource"] = Relationship(
         back_populates="groups", link_model=GroupResource
     )
-    roles: List["Role"] = Relationship(back_populates="group")
+    roles: list["Role"] = Relationship(back_populates="group")
     admin: Optional["User"] = Relationship(
         sa_relationship_kwargs={
             "primaryjoin": "Group.admin_id==User.id",
@@ -230,10 +306,18 @@ class Role(RoleBase, table=True):
     parent_role_id: int | None = Field(default=None, foreign_key="role.id")
 
     # Relationships
-    users: List["User"] = Relationship(back_populates="roles", link_model=UserRole)
-    accesses: List["RoleAccess"] = Relationship(back_populates="role")
+    users: list["User"] = Relationship(
+        back_populates="roles",
+        link_model=UserRole,
+        sa_relationship_kwargs={"lazy": settings.LAZY_STRATEGY},
+    )
+    accesses: list["RoleAccess"] = Relationship(back_populates="role")
     parent_role: Optional["Role"] = Relationship(
-        sa_relationship_kwargs={"remote_side": "Role.id", "backref": "child_roles"}
+        sa_relationship_kwargs={
+            "remote_side": "Role.id",
+            "backref": "child_roles",
+            "lazy": settings.LAZY_STRATEGY,
+        }
     )
     group: "Group" = Relationship(back_populates="roles")
 
@@ -250,7 +334,7 @@ class RoleUpdate(RoleBase):
     is_system_role: Optional[bool] = None
 
 
-class RoleOut(RoleBase):
+class RoleOut(RoleBase, TrustedOut):
     """Schema for role output"""
 
     id: int
@@ -316,20 +400,20 @@ class User(UserBase, table=True):
     hashed_password: str
 
     # RBAC relationships
-    roles: List["Role"] = Relationship(back_populates="users", link_model=UserRole)
-    groups: List["Group"] = Relationship(back_populates="users", link_model=UserGroup)
+    roles: list["Role"] = Relationship(back_populates="users", link_model=UserRole)
+    groups: list["Group"] = Relationship(back_populates="users", link_model=UserGroup)
 
     # Original relationships
-    teams: List["Team"] = Relationship(back_populates="owner")
-    skills: List["Skill"] = Relationship(back_populates="owner")
-    uploads: List["Upload"] = Relationship(back_populates="owner")
-    graphs: List["Graph"] = Relationship(back_populates="owner")
-    subgraphs: List["Subgraph"] = Relationship(back_populates="owner")
+    teams: list["Team"] = Relationship(back_populates="owner")
+    skills: list["Skill"] = Relationship(back_populates="owner")
+    uploads: list["Upload"] = Relationship(back_populates="owner")
+    graphs: list["Graph"] = Relationship(back_populates="owner")
+    subgraphs: list["Subgraph"] = Relationship(back_populates="owner")
     language: str = Field(default="en-US")
 
 
 # Properties to return via API
-class UserOut(UserBase):
+class UserOut(UserBase, TrustedOut):
     id: int
     groups: list["Group"] | None = None
     roles: list["Role"] | None = None
@@ -340,7 +424,7 @@ class UsersOut(SQLModel):
     count: int
 
 
-class GroupOut(GroupBase):
+class GroupOut(GroupBase, TrustedOut):
     """Schema for group output"""
 
     id: int
@@ -359,7 +443,7 @@ class GroupsOut(SQLModel):
 
 
 class TeamBase(SQLModel):
-    name: str = PydanticField(pattern=r"^[a-zA-Z0-9_-]{1,64}$")
+    name: str = PydanticField(pattern=NAME_PATTERN)
     description: str | None = None
     # 增加team的图标
     icon: str | None = None
@@ -370,10 +454,10 @@ class TeamCreate(TeamBase):
 
 
 class TeamUpdate(TeamBase):
-    name: str | None = PydanticField(pattern=r"^[a-zA-Z0-9_-]{1,64}$", default=None)  # type: ignore[assignment]
+    name: str | None = PydanticField(pattern=NAME_PATTERN, default=None)  # type: ignore[assignment]
 
 
-class ChatMessageType(str, Enum):
+class ChatMessageType(StrEnum):
     human = "human"
     ai = "ai"
 
@@ -384,13 +468,13 @@ class ChatMessage(BaseModel):
     imgdata: str | None = None  # 添加 imgdata 字段
 
 
-class InterruptType(str, Enum):
+class InterruptType(StrEnum):
     TOOL_REVIEW = "tool_review"
     OUTPUT_REVIEW = "output_review"
     CONTEXT_INPUT = "context_input"
 
 
-class InterruptDecision(str, Enum):
+class InterruptDecision(StrEnum):
     APPROVED = "approved"
     REJECTED = "rejected"
     REPLIED = "replied"
@@ -413,43 +497,55 @@ class TeamChat(BaseModel):
 
 
 class TeamChatPublic(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     message: ChatMessage | None = None
     interrupt: Interrupt | None = None
 
     @model_validator(mode="after")
-    def check_either_field(cls: Any, values: Any) -> Any:
-        message, interrupt = values.message, values.interrupt
-        if not message and not interrupt:
+    def check_either_field(self) -> "TeamChatPublic":
+        if self.message is None and self.interrupt is None:
             raise ValueError('Either "message" or "interrupt" must be provided.')
-        return values
+        return self
 
 
 class Team(TeamBase, table=True):
+    __table_args__ = (
+        # Covers owner-scoped team listings without touching the heap
+        Index(
+            "ix_team_owner_name", "owner_id", "name", postgresql_include=["resource_id"]
+        ),
+    )
     id: int | None = Field(default=None, primary_key=True)
-    name: str = Field(regex=r"^[a-zA-Z0-9_-]{1,64}$", unique=True)
+    name: str = Field(regex=NAME_PATTERN, unique=True)
     resource_id: int = Field(foreign_key="resource.id", nullable=False)
     owner_id: int | None = Field(default=None, foreign_key="user.id", nullable=False)
     owner: User | None = Relationship(back_populates="teams")
     members: list["Member"] = Relationship(
-        back_populates="belongs", sa_relationship_kwargs={"cascade": "delete"}
+        back_populates="belongs",
+        sa_relationship_kwargs={"cascade": "all, delete", "passive_deletes": True},
     )
     workflow: str  # TODO:
     threads: list["Thread"] = Relationship(
-        back_populates="team", sa_relationship_kwargs={"cascade": "delete"}
+        back_populates="team",
+        sa_relationship_kwargs={"cascade": "all, delete", "passive_deletes": True},
     )
     graphs: list["Graph"] = Relationship(
-        back_populates="team", sa_relationship_kwargs={"cascade": "delete"}
+        back_populates="team",
+        sa_relationship_kwargs={"cascade": "all, delete", "passive_deletes": True},
     )
     subgraphs: list["Subgraph"] = Relationship(
-        back_populates="team", sa_relationship_kwargs={"cascade": "delete"}
+        back_populates="team",
+        sa_relationship_kwargs={"cascade": "all, delete", "passive_deletes": True},
     )
     apikeys: list["ApiKey"] = Relationship(
-        back_populates="team", sa_relationship_kwargs={"cascade": "delete"}
+        back_populates="team",
+        sa_relationship_kwargs={"cascade": "all, delete", "passive_deletes": True},
     )
 
 
 # Properties to return via API, id is always required
-class TeamOut(TeamBase):
+class TeamOut(TeamBase, TrustedOut):
     id: int
     owner_id: int
     workflow: str
@@ -478,31 +574,28 @@ class ThreadUpdate(ThreadBase):
 
 class Thread(ThreadBase, table=True):
     id: UUID | None = Field(
-        default_factory=uuid4,
+        default_factory=uuid7,
         primary_key=True,
         index=True,
         nullable=False,
     )
-    updated_at: datetime | None = Field(
-        sa_column=Column(
-            DateTime(timezone=True),
-            nullable=False,
-            default=func.now(),
-            onupdate=func.now(),
-            server_default=func.now(),
-        )
+    updated_at: datetime | None = Field(sa_column=ts_col(onupdate=func.now()))
+    team_id: int | None = Field(
+        default=None, foreign_key="team.id", nullable=False, ondelete="CASCADE"
     )
-    team_id: int | None = Field(default=None, foreign_key="team.id", nullable=False)
     team: Team | None = Relationship(back_populates="threads")
     checkpoints: list["Checkpoint"] = Relationship(
-        back_populates="thread", sa_relationship_kwargs={"cascade": "delete"}
+        back_populates="thread",
+        sa_relationship_kwargs={"cascade": "all, delete", "passive_deletes": True},
     )
     checkpoint_blobs: list["CheckpointBlobs"] = Relationship(
-        back_populates="thread", sa_relationship_kwargs={"cascade": "delete"}
+        back_populates="thread",
+        sa_relationship_kwargs={"cascade": "all, delete", "passive_deletes": True},
     )
 
     writes: list["Write"] = Relationship(
-        back_populates="thread", sa_relationship_kwargs={"cascade": "delete"}
+        back_populates="thread",
+        sa_relationship_kwargs={"cascade": "all, delete", "passive_deletes": True},
     )
 
 
@@ -526,14 +619,14 @@ class ThreadsOut(SQLModel):
 
 class MemberSkillsLink(SQLModel, table=True):
     member_id: int | None = Field(
-        default=None, foreign_key="member.id", primary_key=True
+        default=None, foreign_key="member.id", primary_key=True, ondelete="CASCADE"
     )
     skill_id: int | None = Field(default=None, foreign_key="skill.id", primary_key=True)
 
 
 class MemberUploadsLink(SQLModel, table=True):
     member_id: int | None = Field(
-        default=None, foreign_key="member.id", primary_key=True
+        default=None, foreign_key="member.id", primary_key=True, ondelete="CASCADE"
     )
     upload_id: int | None = Field(
         default=None, foreign_key="upload.id", primary_key=True
@@ -541,7 +634,7 @@ class MemberUploadsLink(SQLModel, table=True):
 
 
 class MemberBase(SQLModel):
-    name: str = PydanticField(pattern=r"^[a-zA-Z0-9_-]{1,64}$")
+    name: str = PydanticField(pattern=NAME_PATTERN)
     backstory: str | None = None
     role: str
     type: str  # one of: leader, worker, freelancer
@@ -561,7 +654,7 @@ class MemberCreate(MemberBase):
 
 
 class MemberUpdate(MemberBase):
-    name: str | None = PydanticField(pattern=r"^[a-zA-Z0-9_-]{1,64}$", default=None)  # type: ignore[assignment]
+    name: str | None = PydanticField(pattern=NAME_PATTERN, default=None)  # type: ignore[assignment]
     backstory: str | None = None
     role: str | None = None  # type: ignore[assignment]
     type: str | None = None  # type: ignore[assignment]
@@ -582,7 +675,9 @@ class Member(MemberBase, table=True):
         UniqueConstraint("name", "belongs_to", name="unique_team_and_name"),
     )
     id: int | None = Field(default=None, primary_key=True)
-    belongs_to: int | None = Field(default=None, foreign_key="team.id", nullable=False)
+    belongs_to: int | None = Field(
+        default=None, foreign_key="team.id", nullable=False, ondelete="CASCADE"
+    )
     belongs: Team | None = Relationship(back_populates="members")
     skills: list["Skill"] = Relationship(
         back_populates="members",
@@ -671,8 +766,21 @@ class Checkpoint(SQLModel, table=True):
     __tablename__ = "checkpoints"
     __table_args__ = (
         PrimaryKeyConstraint("thread_id", "checkpoint_id", "checkpoint_ns"),
+        # The primary key is not ordered for the per-namespace "latest checkpoint"
+        # lookups LangGraph issues
+        Index(
+            "ix_checkpoints_thread_ns_id", "thread_id", "checkpoint_ns", "checkpoint_id"
+        ),
+        Index(
+            "ix_checkpoints_thread_parent",
+            "thread_id",
+            "parent_checkpoint_id",
+            postgresql_where=text("parent_checkpoint_id IS NOT NULL"),
+        ),
+    )
+    thread_id: UUID = Field(
+        foreign_key="thread.id", primary_key=True, ondelete="CASCADE"
     )
-    thread_id: UUID = Field(foreign_key="thread.id", primary_key=True)
     checkpoint_ns: str = Field(
         sa_column=Column(
             "checkpoint_ns", String, nullable=False, server_default="", primary_key=True
@@ -684,17 +792,12 @@ class Checkpoint(SQLModel, table=True):
     checkpoint: dict[Any, Any] = Field(default_factory=dict, sa_column=Column(JSONB))
     metadata_: dict[Any, Any] = Field(
         default_factory=dict,
-        sa_column=Column("metadata", JSONB, nullable=False, server_default="{}"),
-    )
-    thread: Thread = Relationship(back_populates="checkpoints")
-    created_at: datetime | None = Field(
         sa_column=Column(
-            DateTime(timezone=True),
-            nullable=False,
-            default=func.now(),
-            server_default=func.now(),
-        )
+            "metadata", JSONB, nullable=False, server_default=text("'{}'::jsonb")
+        ),
     )
+    thread: Thread = Relationship(back_populates="checkpoints")
+    created_at: datetime | None = Field(sa_column=ts_col())
 
 
 class CheckpointBlobs(SQLModel, table=True):
@@ -702,7 +805,9 @@ class CheckpointBlobs(SQLModel, table=True):
     __table_args__ = (
         PrimaryKeyConstraint("thread_id", "checkpoint_ns", "channel", "version"),
     )
-    thread_id: UUID = Field(foreign_key="thread.id", primary_key=True)
+    thread_id: UUID = Field(
+        foreign_key="thread.id", primary_key=True, ondelete="CASCADE"
+    )
     checkpoint_ns: str = Field(
         sa_column=Column(
             "checkpoint_ns", String, nullable=False, server_default="", primary_key=True
@@ -729,7 +834,9 @@ class Write(SQLModel, table=True):
             "thread_id", "checkpoint_ns", "checkpoint_id", "task_id", "idx"
         ),
     )
-    thread_id: UUID = Field(foreign_key="thread.id", primary_key=True)
+    thread_id: UUID = Field(
+        foreign_key="thread.id", primary_key=True, ondelete="CASCADE"
+    )
     checkpoint_ns: str = Field(
         sa_column=Column(
             "checkpoint_ns", String, nullable=False, server_default="", primary_key=True
@@ -762,19 +869,22 @@ class UploadCreate(UploadBase):
 class UploadUpdate(UploadBase):
     name: str | None = None
     description: str | None = None
-    last_modified: datetime
+    last_modified: datetime | None = None
     file_type: str | None = None
     web_url: str | None = None
     chunk_size: int | None = None
     chunk_overlap: int | None = None
 
 
-class UploadStatus(str, Enum):
+class UploadStatus(StrEnum):
     IN_PROGRESS = "In Progress"
     COMPLETED = "Completed"
     FAILED = "Failed"
 
 
+_UPLOAD_STATUS_TYPE = SQLEnum(UploadStatus, name="uploadstatus")
+
+
 class Upload(UploadBase, table=True):
     id: int | None = Field(default=None, primary_key=True)
     resource_id: int = Field(foreign_key="resource.id", nullable=False)
@@ -784,15 +894,13 @@ class Upload(UploadBase, table=True):
         back_populates="uploads",
         link_model=MemberUploadsLink,
     )
-    last_modified: datetime = Field(default_factory=lambda: datetime.now())
-    status: UploadStatus = Field(
-        sa_column=Column(SQLEnum(UploadStatus), nullable=False)
-    )
+    last_modified: datetime | None = Field(sa_column=ts_col(onupdate=func.now()))
+    status: UploadStatus = Field(sa_column=Column(_UPLOAD_STATUS_TYPE, nullable=False))
     chunk_size: int
     chunk_overlap: int
 
 
-class UploadOut(UploadBase):
+class UploadOut(UploadBase, TrustedOut):
     id: int
     name: str
     last_modified: datetime
@@ -813,7 +921,7 @@ class UploadsOut(SQLModel):
 
 
 class ModelProviderBase(SQLModel):
-    provider_name: str = PydanticField(pattern=r"^[a-zA-Z0-9_-]{1,64}$", unique=True)
+    provider_name: str = PydanticField(pattern=NAME_PATTERN, unique=True)
     base_url: str | None = None
     api_key: str | None = None
     icon: str | None = None
@@ -825,7 +933,7 @@ class ModelProviderCreate(ModelProviderBase):
 
 
 class ModelProviderUpdate(ModelProviderBase):
-    provider_name: str | None = PydanticField(pattern=r"^[a-zA-Z0-9_-]{1,64}$", default=None, unique=True)  # type: ignore[assignment]
+    provider_name: str | None = PydanticField(pattern=NAME_PATTERN, default=None, unique=True)  # type: ignore[assignment]
     description: str | None = None
 
 
@@ -844,27 +952,35 @@ class ModelProvider(ModelProviderBase, table=True):
             return self.api_key  # 已经是加密的
         return None
 
-    @property
+    @cached_property
     def decrypted_api_key(self) -> str | None:
-        """获取解密后的API密钥，用于内部业务逻辑"""
+        """获取解密后的API密钥，用于内部业务逻辑（每个实例只解密一次）"""
+        from app.core.security import security_manager
+
         if self.api_key:
             return security_manager.decrypt_api_key(self.api_key)
         return None
 
     def set_api_key(self, value: str | None) -> None:
         """设置并加密API密钥"""
+        from app.core.security import security_manager
+
         if value:
             self.api_key = security_manager.encrypt_api_key(value)
         else:
             self.api_key = None
+        # 清除已缓存的解密结果
+        self.__dict__.pop("decrypted_api_key", None)
 
     # Relationship with Model
     models: list["Models"] = Relationship(
-        back_populates="provider", cascade_delete="all, delete-orphan"
+        back_populates="provider",
+        cascade_delete="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
-class ModelCategory(str, Enum):
+class ModelCategory(StrEnum):
     LLM = "llm"
     CHAT = "chat"
     TEXT_EMBEDDING = "text-embedding"
@@ -873,37 +989,61 @@ class ModelCategory(str, Enum):
     TEXT_TO_SPEECH = "text-to-speech"
 
 
-class ModelCapability(str, Enum):
+class ModelCapability(StrEnum):
     VISION = "vision"
 
 
+# Native Postgres enums labelled with the enum values, created by migration
+_MODEL_CATEGORY_TYPE = ENUM(
+    ModelCategory,
+    name="model_category",
+    create_type=False,
+    values_callable=lambda e: [m.value for m in e],
+)
+_MODEL_CAPABILITY_TYPE = ENUM(
+    ModelCapability,
+    name="model_capability",
+    create_type=False,
+    values_callable=lambda e: [m.value for m in e],
+)
+
+
 class ModelsBase(SQLModel):
-    ai_model_name: str = PydanticField(pattern=r"^[a-zA-Z0-9/_:.-]{1,64}$", unique=True)
+    ai_model_name: str = PydanticField(pattern=MODEL_NAME_PATTERN, unique=True)
     provider_id: int
-    categories: list[ModelCategory] = Field(sa_column=Column(ARRAY(String)))
+    categories: list[ModelCategory] = Field(
+        sa_column=Column(ARRAY(_MODEL_CATEGORY_TYPE))
+    )
     capabilities: list[ModelCapability] = Field(
-        sa_column=Column(ARRAY(String)), default=[]
+        sa_column=Column(ARRAY(_MODEL_CAPABILITY_TYPE)), default=[]
     )
 
 
 class Models(ModelsBase, table=True):
+    __table_args__ = (
+        Index("models_categories_gin", "categories", postgresql_using="gin"),
+    )
     id: int | None = Field(default=None, primary_key=True)
     ai_model_name: str = Field(max_length=128)
-    provider_id: int = Field(foreign_key="modelprovider.id")
-    categories: list[ModelCategory] = Field(sa_column=Column(ARRAY(String)))
+    provider_id: int = Field(foreign_key="modelprovider.id", ondelete="CASCADE")
+    categories: list[ModelCategory] = Field(
+        sa_column=Column(ARRAY(_MODEL_CATEGORY_TYPE))
+    )
     capabilities: list[ModelCapability] = Field(
-        sa_column=Column(ARRAY(String)), default=[]
+        sa_column=Column(ARRAY(_MODEL_CAPABILITY_TYPE)), default=[]
     )
     meta_: dict[str, Any] = Field(
         default_factory=dict,
-        sa_column=Column("metadata", JSONB, nullable=False, server_default="{}"),
+        sa_column=Column(
+            "metadata", JSONB, nullable=False, server_default=text("'{}'::jsonb")
+        ),
     )
     # Relationship with ModelProvider
     provider: ModelProvider = Relationship(back_populates="models")
 
 
 # Properties to return via API
-class ModelProviderOut(SQLModel):
+class ModelProviderOut(TrustedOut):
     id: int
     provider_name: str
     base_url: str | None
@@ -915,7 +1055,7 @@ class ModelProviderOut(SQLModel):
         from_attributes = True
 
 
-class ModelOut(SQLModel):
+class ModelOut(TrustedOut):
     id: int
     ai_model_name: str
     categories: list[ModelCategory]
@@ -953,12 +1093,14 @@ class ProvidersListWithModelsOut(SQLModel):
 
 
 class GraphBase(SQLModel):
-    name: str = PydanticField(pattern=r"^[a-zA-Z0-9_-]{1,64}$")
+    name: str = PydanticField(pattern=NAME_PATTERN)
     description: str | None = None
     config: dict[Any, Any] = Field(default_factory=dict, sa_column=Column(JSONB))
     metadata_: dict[Any, Any] = Field(
         default_factory=dict,
-        sa_column=Column("metadata", JSONB, nullable=False, server_default="{}"),
+        sa_column=Column(
+            "metadata", JSONB, nullable=False, server_default=text("'{}'::jsonb")
+        ),
     )
 
 
@@ -977,28 +1119,13 @@ class Graph(GraphBase, table=True):
     resource_id: int = Field(foreign_key="resource.id", nullable=False)
     owner_id: int | None = Field(default=None, foreign_key="user.id", nullable=False)
     owner: User | None = Relationship(back_populates="graphs")
-    team_id: int = Field(foreign_key="team.id", nullable=False)
+    team_id: int = Field(foreign_key="team.id", nullable=False, ondelete="CASCADE")
     team: Team = Relationship(back_populates="graphs")
-    created_at: datetime | None = Field(
-        sa_column=Column(
-            DateTime(timezone=True),
-            nullable=False,
-            default=func.now(),
-            server_default=func.now(),
-        )
-    )
-    updated_at: datetime | None = Field(
-        sa_column=Column(
-            DateTime(timezone=True),
-            nullable=False,
-            default=func.now(),
-            onupdate=func.now(),
-            server_default=func.now(),
-        )
-    )
+    created_at: datetime | None = Field(sa_column=ts_col())
+    updated_at: datetime | None = Field(sa_column=ts_col(onupdate=func.now()))
 
 
-class GraphOut(GraphBase):
+class GraphOut(GraphBase, TrustedOut):
     id: int
 
 
@@ -1020,11 +1147,11 @@ class ApiKey(ApiKeyBase, table=True):
     id: int | None = Field(default=None, primary_key=True)
     hashed_key: str
     short_key: str
-    team_id: int | None = Field(default=None, foreign_key="team.id", nullable=False)
-    team: Team | None = Relationship(back_populates="apikeys")
-    created_at: datetime | None = Field(
-        default_factory=lambda: datetime.now(ZoneInfo("UTC"))
+    team_id: int | None = Field(
+        default=None, foreign_key="team.id", nullable=False, ondelete="CASCADE"
     )
+    team: Team | None = Relationship(back_populates="apikeys")
+    created_at: datetime | None = Field(sa_column=ts_col())
 
 
 class ApiKeyOut(ApiKeyBase):
@@ -1033,7 +1160,7 @@ class ApiKeyOut(ApiKeyBase):
     created_at: datetime
 
 
-class ApiKeyOutPublic(ApiKeyBase):
+class ApiKeyOutPublic(ApiKeyBase, TrustedOut):
     id: int
     short_key: str
     created_at: datetime
@@ -1047,63 +1174,126 @@ class ApiKeysOutPublic(SQLModel):
 # ==============Subgraph=====================
 
 
+@with_config(ConfigDict(extra="allow"))
+class SubgraphConfig(TypedDict, total=False):
+    """Graph config stored on a subgraph, as built by the web flow editor"""
+
+    id: str
+    name: str
+    nodes: list[dict[str, Any]]
+    edges: list[dict[str, Any]]
+    metadata: dict[str, Any]
+
+
+# Upper bound for the serialized size of a subgraph's config and metadata
+MAX_SUBGRAPH_JSONB_BYTES = 1024 * 1024
+# Deletes every character allowed by NAME_PATTERN, see SubgraphBase.check_name
+_NAME_CHARS_TABLE = str.maketrans("", "", string.ascii_letters + string.digits + "_-")
+
+
 class SubgraphBase(SQLModel):
-    name: str = PydanticField(pattern=r"^[a-zA-Z0-9_-]{1,64}$")
+    # The pattern is only advertised in the schema, check_name enforces it
+    name: str = PydanticField(json_schema_extra={"pattern": NAME_PATTERN})
     description: str | None = None
-    config: dict[Any, Any] = Field(default_factory=dict, sa_column=Column(JSONB))
+    config: SubgraphConfig = Field(default_factory=dict, sa_column=Column(JSONB))
     metadata_: dict[Any, Any] = Field(
         default_factory=dict,
-        sa_column=Column("metadata", JSONB, nullable=False, server_default="{}"),
+        sa_column=Column(
+            "metadata", JSONB, nullable=False, server_default=text("'{}'::jsonb")
+        ),
     )
     is_public: bool = Field(default=False)  # 是否公开，可供其他用户使用
 
+    @field_validator("name")
+    @classmethod
+    def check_name(cls, v: str | None) -> str | None:
+        """Same rule as NAME_PATTERN, checked without the regex engine"""
+        if v is None:
+            return v
+        if not 0 < len(v) <= 64 or v.translate(_NAME_CHARS_TABLE):
+            raise ValueError(f"String should match pattern '{NAME_PATTERN}'")
+        return v
+
+    @field_validator("config", "metadata_", mode="before")
+    @classmethod
+    def check_jsonb_size(cls, v: Any) -> Any:
+        """Reject oversized JSONB payloads before validating their contents"""
+        try:
+            size = len(orjson.dumps(v, option=orjson.OPT_NON_STR_KEYS))
+        except orjson.JSONEncodeError:
+            return v  # left for the type validation to reject
+        if size > MAX_SUBGRAPH_JSONB_BYTES:
+            raise ValueError(
+                f"JSON payload is {size} bytes, limit is {MAX_SUBGRAPH_JSONB_BYTES}"
+            )
+        return v
+
 
 class SubgraphCreate(SubgraphBase):
-    created_at: datetime
-    updated_at: datetime
+    # 时间戳由服务端维护，客户端传入的值会被忽略
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
     team_id: int
 
 
 class SubgraphUpdate(SubgraphBase):
     name: str | None = None
-    updated_at: datetime
+    updated_at: datetime | None = None
     id: int | None = None
     team_id: int | None = None
 
 
 class Subgraph(SubgraphBase, table=True):
+    __table_args__ = (
+        # Only containment (@>) lookups are expected, jsonb_path_ops keeps
+        # these indexes small
+        Index(
+            "ix_subgraph_config_gin",
+            "config",
+            postgresql_using="gin",
+            postgresql_ops={"config": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_subgraph_metadata_gin",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
+    )
     id: int | None = Field(default=None, primary_key=True)
     resource_id: int = Field(foreign_key="resource.id", nullable=False)
     owner_id: int | None = Field(default=None, foreign_key="user.id", nullable=False)
     owner: User | None = Relationship(back_populates="subgraphs")
-    team_id: int = Field(foreign_key="team.id", nullable=False)
+    team_id: int = Field(foreign_key="team.id", nullable=False, ondelete="CASCADE")
     team: Team = Relationship(back_populates="subgraphs")
-    created_at: datetime | None = Field(
-        sa_column=Column(
-            DateTime(timezone=True),
-            nullable=False,
-            default=func.now(),
-            server_default=func.now(),
-        )
-    )
-    updated_at: datetime | None = Field(
-        sa_column=Column(
-            DateTime(timezone=True),
-            nullable=False,
-            default=func.now(),
-            onupdate=func.now(),
-            server_default=func.now(),
-        )
-    )
+    created_at: datetime | None = Field(sa_column=ts_col())
+    # Bumped by the routes only when a column actually changes
+    updated_at: datetime | None = Field(sa_column=ts_col())
 
 
-class SubgraphOut(SubgraphBase):
+@dataclass(slots=True, frozen=True)
+class SubgraphOut:
+    """Outbound-only subgraph response, never validated or persisted"""
+
+    name: Annotated[str, PydanticField(json_schema_extra={"pattern": NAME_PATTERN})]
+    description: str | None
+    config: SubgraphConfig
+    metadata_: dict[Any, Any]
+    is_public: bool
     id: int
     owner_id: int
     team_id: int
     created_at: datetime
     updated_at: datetime
 
+    @classmethod
+    def from_orm_unvalidated(cls, obj: Any) -> "SubgraphOut":
+        """Build the response from a trusted ORM object, reading fields by name"""
+        return cls(**{name: getattr(obj, name) for name in SUBGRAPH_OUT_FIELDS})
+
+
+SUBGRAPH_OUT_FIELDS = tuple(field.name for field in fields(SubgraphOut))
+
 
 class SubgraphsOut(SQLModel):
     data: list[SubgraphOut]
@@ -72,6 +72,7 @@ export type { SkillCreate } from "./models/SkillCreate";
 export type { SkillOut } from "./models/SkillOut";
 export type { SkillsOut } from "./models/SkillsOut";
 export type { SkillUpdate } from "./models/SkillUpdate";
+export type { SubgraphConfig } from "./models/SubgraphConfig";
 export type { SubgraphCreate } from "./models/SubgraphCreate";
 export type { SubgraphOut } from "./models/SubgraphOut";
 export type { SubgraphsOut } from "./models/SubgraphsOut";
@@ -172,6 +173,7 @@ export { $SkillCreate } from "./schemas/$SkillCreate";
 export { $SkillOut } from "./schemas/$SkillOut";
 export { $SkillsOut } from "./schemas/$SkillsOut";
 export { $SkillUpdate } from "./schemas/$SkillUpdate";
+export { $SubgraphConfig } from "./schemas/$SubgraphConfig";
 export { $SubgraphCreate } from "./schemas/$SubgraphCreate";
 export { $SubgraphOut } from "./schemas/$SubgraphOut";
 export { $SubgraphsOut } from "./schemas/$SubgraphsOut";
@@ -7,7 +7,7 @@ export type GenerateProseRequest = {
   /**
    * The content of the prose
    */
-  prompt: string;
+  prompt?: string | null;
   /**
    * The option of the prose writer
    */
@@ -16,4 +16,8 @@ export type GenerateProseRequest = {
    * The user custom command of the prose writer
    */
   command?: string | null;
+  /**
+   * The contents to fix in one batch (fix_batch option)
+   */
+  contents?: Array<string> | null;
 };
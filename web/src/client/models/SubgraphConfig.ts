@@ -0,0 +1,9 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+
+/**
+ * Graph config stored on a subgraph, as built by the web flow editor
+ */
+export type SubgraphConfig = Record<string, any>;
@@ -3,13 +3,15 @@
 /* tslint:disable */
 /* eslint-disable */
 
+import type { SubgraphConfig } from "./SubgraphConfig";
+
 export type SubgraphCreate = {
   name: string;
   description?: string | null;
-  config?: Record<string, any>;
+  config?: SubgraphConfig;
   metadata_?: Record<string, any>;
   is_public?: boolean;
-  created_at: string;
-  updated_at: string;
+  created_at?: string | null;
+  updated_at?: string | null;
   team_id: number;
 };
@@ -3,12 +3,14 @@
 /* tslint:disable */
 /* eslint-disable */
 
+import type { SubgraphConfig } from "./SubgraphConfig";
+
 export type SubgraphOut = {
   name: string;
-  description?: string | null;
-  config?: Record<string, any>;
-  metadata_?: Record<string, any>;
-  is_public?: boolean;
+  description: string | null;
+  config: SubgraphConfig;
+  metadata_: Record<string, any>;
+  is_public: boolean;
   id: number;
   owner_id: number;
   team_id: number;
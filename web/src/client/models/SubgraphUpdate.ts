@@ -3,13 +3,15 @@
 /* tslint:disable */
 /* eslint-disable */
 
+import type { SubgraphConfig } from "./SubgraphConfig";
+
 export type SubgraphUpdate = {
   name?: string | null;
   description?: string | null;
-  config?: Record<string, any>;
+  config?: SubgraphConfig;
   metadata_?: Record<string, any>;
   is_public?: boolean;
-  updated_at: string;
+  updated_at?: string | null;
   id?: number | null;
   team_id?: number | null;
 };
@@ -13,7 +13,7 @@ export type Upload = {
   id?: number | null;
   resource_id: number;
   owner_id?: number | null;
-  last_modified?: string;
+  last_modified: string | null;
   status: UploadStatus;
   chunk_size: number;
   chunk_overlap: number;
@@ -5,9 +5,16 @@
 export const $GenerateProseRequest = {
   properties: {
     prompt: {
-      type: "string",
+      type: "any-of",
       description: `The content of the prose`,
-      isRequired: true,
+      contains: [
+        {
+          type: "string",
+        },
+        {
+          type: "null",
+        },
+      ],
     },
     option: {
       type: "string",
@@ -26,5 +33,20 @@ export const $GenerateProseRequest = {
         },
       ],
     },
+    contents: {
+      type: "any-of",
+      description: `The contents to fix in one batch (fix_batch option)`,
+      contains: [
+        {
+          type: "array",
+          contains: {
+            type: "string",
+          },
+        },
+        {
+          type: "null",
+        },
+      ],
+    },
   },
 } as const;
@@ -0,0 +1,10 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+export const $SubgraphConfig = {
+  type: "dictionary",
+  contains: {
+    properties: {},
+  },
+} as const;
@@ -21,10 +21,7 @@ export const $SubgraphCreate = {
       ],
     },
     config: {
-      type: "dictionary",
-      contains: {
-        properties: {},
-      },
+      type: "SubgraphConfig",
     },
     metadata_: {
       type: "dictionary",
@@ -36,14 +33,28 @@ export const $SubgraphCreate = {
       type: "boolean",
     },
     created_at: {
-      type: "string",
-      isRequired: true,
-      format: "date-time",
+      type: "any-of",
+      contains: [
+        {
+          type: "string",
+          format: "date-time",
+        },
+        {
+          type: "null",
+        },
+      ],
     },
     updated_at: {
-      type: "string",
-      isRequired: true,
-      format: "date-time",
+      type: "any-of",
+      contains: [
+        {
+          type: "string",
+          format: "date-time",
+        },
+        {
+          type: "null",
+        },
+      ],
     },
     team_id: {
       type: "number",
@@ -19,21 +19,22 @@ export const $SubgraphOut = {
           type: "null",
         },
       ],
+      isRequired: true,
     },
     config: {
-      type: "dictionary",
-      contains: {
-        properties: {},
-      },
+      type: "SubgraphConfig",
+      isRequired: true,
     },
     metadata_: {
       type: "dictionary",
       contains: {
         properties: {},
       },
+      isRequired: true,
     },
     is_public: {
       type: "boolean",
+      isRequired: true,
     },
     id: {
       type: "number",
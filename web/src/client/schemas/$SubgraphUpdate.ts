@@ -27,10 +27,7 @@ export const $SubgraphUpdate = {
       ],
     },
     config: {
-      type: "dictionary",
-      contains: {
-        properties: {},
-      },
+      type: "SubgraphConfig",
     },
     metadata_: {
       type: "dictionary",
@@ -42,9 +39,16 @@ export const $SubgraphUpdate = {
       type: "boolean",
     },
     updated_at: {
-      type: "string",
-      isRequired: true,
-      format: "date-time",
+      type: "any-of",
+      contains: [
+        {
+          type: "string",
+          format: "date-time",
+        },
+        {
+          type: "null",
+        },
+      ],
     },
     id: {
       type: "any-of",
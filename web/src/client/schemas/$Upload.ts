@@ -54,8 +54,17 @@ export const $Upload = {
       ],
     },
     last_modified: {
-      type: "string",
-      format: "date-time",
+      type: "any-of",
+      contains: [
+        {
+          type: "string",
+          format: "date-time",
+        },
+        {
+          type: "null",
+        },
+      ],
+      isRequired: true,
     },
     status: {
       type: "UploadStatus",
@@ -139,6 +139,28 @@ export class SubgraphsService {
     });
   }
 
+  /**
+   * Create Subgraphs
+   * Create several new subgraphs at once.
+   * @returns SubgraphsOut Successful Response
+   * @throws ApiError
+   */
+  public static createSubgraphs({
+    requestBody,
+  }: {
+    requestBody: Array<SubgraphCreate>;
+  }): CancelablePromise<SubgraphsOut> {
+    return __request(OpenAPI, {
+      method: "POST",
+      url: "/api/v1/teams/{team_id}/subgraphs/bulk",
+      body: requestBody,
+      mediaType: "application/json",
+      errors: {
+        422: `Validation Error`,
+      },
+    });
+  }
+
   /**
    * Read All Public Subgraphs
    * Retrieve all public subgraphs.